@@ -1,12 +1,12 @@
+import time
+
+_START_TIME = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import tkinterdnd2 as tkdnd
-import requests
 import base64
 import threading
 from pathlib import Path
-import time
-from docx import Document
 import os
 import subprocess
 import platform
@@ -47,6 +47,7 @@ class MistralOCRTool:
         # Create menu bar
         self.create_menu()
         self.setup_ui()
+        self.log_msg(f"Started in {time.perf_counter() - _START_TIME:.2f}s")
         
     def create_menu(self):
         """Create application menu"""
@@ -179,6 +180,7 @@ class MistralOCRTool:
         self.drop_label.pack(expand=True)
         
         # Drag & drop setup
+        import tkinterdnd2 as tkdnd
         self.drop_area.drop_target_register(tkdnd.DND_FILES)
         self.drop_area.dnd_bind('<<Drop>>', self.on_drop)
         self.drop_area.dnd_bind('<<DragEnter>>', lambda e: self.drop_area.configure(bg='#475569'))
@@ -535,6 +537,8 @@ class MistralOCRTool:
     
     def _process_file(self, file_path):
         """Process single file - returns True if successful"""
+        import requests  # Deferred so the network stack loads on first request
+        
         try:
             # Validate file size
             file_size = Path(file_path).stat().st_size
@@ -607,7 +611,8 @@ class MistralOCRTool:
                 counter += 1
             
             if self.output_format.get() == "docx":
-                # Save as DOCX
+                # Save as DOCX (python-docx pulls in lxml, so load it only here)
+                from docx import Document
                 doc = Document()
                 doc.add_heading(f'OCR Results - {base_path.name}', 0)
                 
@@ -646,6 +651,7 @@ class MistralOCRTool:
             return False
 
 def main():
+    import tkinterdnd2 as tkdnd
     root = tkdnd.TkinterDnD.Tk()
     MistralOCRTool(root)
     root.mainloop()